@@ -2,17 +2,11 @@
 
 # pylint: disable=missing-function-docstring, not-callable
 
-import sys
-from pathlib import Path
-
 from behave import given, then, when
 
-# Ensure the project root is on sys.path so we can import the application module.
-PROJECT_ROOT = Path(__file__).resolve().parents[2]
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
-
-from sonarqube_checker import MarkdownReportGenerator  # noqa: E402
+# The project is installed as a package (pip install -e .), so the
+# application module imports without sys.path manipulation.
+from sonarqube_checker import MarkdownReportGenerator
 
 
 @given('the analysis date "{raw_date}"')
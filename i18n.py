@@ -5,7 +5,10 @@ This module provides translations for report generation in multiple languages.
 Translations are loaded from translations.yaml file.
 """
 
+import json
 import os
+import tempfile
+from functools import lru_cache
 
 import yaml
 
@@ -13,10 +16,55 @@ import yaml
 _TRANSLATIONS_CACHE = None
 
 
+def _read_json_cache(cache_file: str, mtime: float, size: int) -> dict:
+    """
+    Read the JSON sidecar cache if it matches the YAML file's (mtime, size).
+
+    Args:
+        cache_file: Path to the JSON cache file
+        mtime: Modification time of the source YAML file
+        size: Size in bytes of the source YAML file
+
+    Returns:
+        Cached translations dictionary, or None if the cache is missing or stale
+    """
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get('mtime') == mtime and cached.get('size') == size:
+            return cached.get('data')
+    except (FileNotFoundError, ValueError, OSError):
+        pass
+    return None
+
+
+def _write_json_cache(cache_file: str, mtime: float, size: int, data: dict) -> None:
+    """
+    Atomically write the JSON sidecar cache (best effort).
+
+    Args:
+        cache_file: Path to the JSON cache file
+        mtime: Modification time of the source YAML file
+        size: Size in bytes of the source YAML file
+        data: Translations dictionary to cache
+    """
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_file), suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({'mtime': mtime, 'size': size, 'data': data}, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_file)
+    except OSError:
+        # Caching is an optimization; a read-only directory must not break loading
+        pass
+
+
 def _load_translations() -> dict:
     """
     Load translations from YAML file.
 
+    A JSON sidecar cache keyed by the YAML file's (mtime, size) is used to
+    skip YAML parsing on subsequent process starts.
+
     Returns:
         Dictionary with translations for all supported languages
     """
@@ -28,11 +76,22 @@ def _load_translations() -> dict:
     # Get the directory where this script is located
     script_dir = os.path.dirname(os.path.abspath(__file__))
     translations_file = os.path.join(script_dir, 'translations.yaml')
+    cache_file = translations_file + '.cache.json'
 
     try:
-        with open(translations_file, 'r', encoding='utf-8') as f:
-            _TRANSLATIONS_CACHE = yaml.safe_load(f)
+        stat = os.stat(translations_file)
+        cached = _read_json_cache(cache_file, stat.st_mtime, stat.st_size)
+        if cached is not None:
+            _TRANSLATIONS_CACHE = cached
             return _TRANSLATIONS_CACHE
+
+        with open(translations_file, 'r', encoding='utf-8') as f:
+            # Prefer the libyaml-backed C loader when available; it is safe
+            # like SafeLoader but parses significantly faster.
+            _TRANSLATIONS_CACHE = yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+
+        _write_json_cache(cache_file, stat.st_mtime, stat.st_size, _TRANSLATIONS_CACHE)
+        return _TRANSLATIONS_CACHE
     except FileNotFoundError:
         # Fallback to hardcoded English translations if file not found
         return {
@@ -52,14 +111,25 @@ def _load_translations() -> dict:
         }
 
 
-# Load translations on module import
-TRANSLATIONS = _load_translations()
+def __getattr__(name: str):
+    """Load translations lazily on first attribute access (PEP 562).
+
+    Keeps `TRANSLATIONS` importable while deferring file I/O and YAML
+    parsing until a consumer actually needs a translation.
+    """
+    if name == 'TRANSLATIONS':
+        return _load_translations()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
+@lru_cache(maxsize=256)
 def get_translation(key: str, language: str = 'en') -> str:
     """
     Get translated string for the given key and language.
 
+    Results are memoized; the key space is the fixed set of labels times
+    the supported languages.
+
     Args:
         key: Translation key
         language: Language code ('en' or 'ru')
@@ -67,12 +137,14 @@ def get_translation(key: str, language: str = 'en') -> str:
     Returns:
         Translated string, or English fallback if not found
     """
+    translations = _load_translations()
+
     # Validate language
-    if language not in TRANSLATIONS:
+    if language not in translations:
         language = 'en'
 
     # Get translation or fallback to English
-    return TRANSLATIONS.get(language, {}).get(key, TRANSLATIONS['en'].get(key, key))
+    return translations.get(language, {}).get(key, translations['en'].get(key, key))
 
 
 def get_all_translations(language: str = 'en') -> dict:
@@ -85,7 +157,9 @@ def get_all_translations(language: str = 'en') -> dict:
     Returns:
         Dictionary of all translations for the language
     """
-    if language not in TRANSLATIONS:
+    translations = _load_translations()
+
+    if language not in translations:
         language = 'en'
 
-    return TRANSLATIONS[language]
+    return translations[language]
@@ -7,64 +7,335 @@ and fetches the latest open issues, then generates a Markdown report.
 """
 
 import argparse
+import json
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 import requests
-from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter, Retry
 from requests.auth import HTTPBasicAuth
 
-from i18n import get_translation
+from i18n import get_all_translations
+
+try:
+    # Optional on-disk HTTP cache for fast repeat runs
+    from requests_cache import CachedSession
+except ImportError:
+    CachedSession = None
+
+try:
+    # Optional fast JSON decoder for large issue/project payloads
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Optional incremental JSON parser for streaming large issue responses
+    import ijson
+except ImportError:
+    ijson = None
+
+
+class IssueRecord:
+    """
+    Compact, fixed-field representation of one SonarQube issue.
+
+    ``__slots__`` drops the per-instance ``__dict__`` and the repeated
+    string keys a plain dict would carry, which matters when thousands of
+    issues are held in memory at once. Dict-style read access (``get`` and
+    subscription) is kept so report code also accepts plain dicts, e.g.
+    fixtures or issues reloaded from the state file.
+    """
+
+    __slots__ = ('severity', 'message', 'component', 'line')
+
+    def __init__(self, severity='N/A', message='N/A', component='N/A', line='N/A'):
+        self.severity = severity
+        self.message = message
+        self.component = component
+        self.line = line
+
+    @classmethod
+    def from_api(cls, issue: Dict) -> 'IssueRecord':
+        """
+        Build a record from a raw issue dictionary, keeping only rendered fields.
+
+        Severity (a handful of fixed values) and component (shared by every
+        issue in the same file) are interned so repeats across thousands of
+        issues share one string object; free-text messages are left alone.
+        """
+        # `or 'N/A'` also covers explicit JSON nulls, which .get's default
+        # would pass through and sys.intern would reject
+        return cls(
+            severity=sys.intern(issue.get('severity') or 'N/A'),
+            message=issue.get('message', 'N/A'),
+            component=sys.intern(issue.get('component') or 'N/A'),
+            line=issue.get('line', 'N/A'),
+        )
+
+    def get(self, key, default=None):
+        """Dict-style lookup of a field by name."""
+        return getattr(self, key, default)
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key)
+
+    def to_dict(self) -> Dict:
+        """Plain-dict form for JSON serialization (state file)."""
+        return {
+            'severity': self.severity,
+            'message': self.message,
+            'component': self.component,
+            'line': self.line,
+        }
+
+
+def _parse_json(response) -> Dict:
+    """
+    Decode a JSON response body, using orjson when available.
+
+    Args:
+        response: requests.Response object
+
+    Returns:
+        Decoded JSON payload as a dictionary
+
+    Raises:
+        requests.exceptions.InvalidJSONError: If the body is not valid JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as exc:
+            # Match response.json(): surface non-JSON bodies (e.g. proxy or
+            # SSO login pages) as a RequestException the callers handle
+            raise requests.exceptions.InvalidJSONError(exc) from exc
+    return response.json()
+
+
+# datetime.fromisoformat parses a trailing 'Z' natively from Python 3.11
+_NATIVE_Z_PARSING = sys.version_info >= (3, 11)
+
+_DISPLAY_DATE_FORMAT = '%Y-%m-%d %H:%M:%S UTC'
+
+
+@lru_cache(maxsize=1024)
+def _format_iso_date(date_str: str) -> str:
+    """
+    Parse an ISO date string and format it for display.
+
+    Memoized: batch reports repeat the same analysis dates, so identical
+    inputs skip the fromisoformat/strftime work.
+
+    Args:
+        date_str: ISO format date string
+
+    Returns:
+        Formatted date string
+
+    Raises:
+        ValueError: If the string is not a valid ISO date
+        AttributeError: If the input is not a string
+    """
+    # Fast path: SonarQube dates are fixed-shape ISO8601 already in UTC
+    # ("2024-01-15T12:00:00+0000"), so slicing skips parsing and strftime
+    if len(date_str) >= 19 and date_str[10] == 'T' and date_str[19:] in ('', 'Z', '+0000', '+00:00'):
+        return f"{date_str[:10]} {date_str[11:19]} UTC"
+    if not _NATIVE_Z_PARSING:
+        date_str = date_str.replace('Z', '+00:00')
+    dt = datetime.fromisoformat(date_str)
+    return dt.strftime(_DISPLAY_DATE_FORMAT)
+
+
+# Translation table escaping Markdown pipes and flattening newlines and
+# carriage returns (which would break table rows); str.translate beats
+# str.replace for single-character substitutions
+_PIPE_ESCAPE = str.maketrans({'|': '\\|', '\n': ' ', '\r': ' '})
+
+# Per-project state from the previous run; lets unchanged projects skip
+# the issues fetch entirely
+_STATE_FILE = '.sonar_state.json'
+
+
+def _load_report_state(path: str = _STATE_FILE) -> Dict:
+    """
+    Load per-project state persisted by a previous run.
+
+    Args:
+        path: Path to the state file
+
+    Returns:
+        Mapping of project key to {'last_analysis': ..., 'issues': [...]},
+        or an empty dict when missing or unreadable
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError, OSError):
+        return {}
+
+
+def _save_report_state(state: Dict, path: str = _STATE_FILE) -> None:
+    """
+    Persist per-project state for the next run (best effort).
+
+    Args:
+        state: Mapping of project key to {'last_analysis': ..., 'issues': [...]}
+        path: Path to the state file
+    """
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False, default=IssueRecord.to_dict)
+    except OSError:
+        # State is an optimization; a read-only directory must not break the run
+        pass
+
+
+# (connect, read) timeouts for every API call: a stalled endpoint fails
+# fast on connect while still allowing slow large responses to stream
+_REQUEST_TIMEOUT = (5, 30)
+
+# Fixed query parameters shared by every /api/issues/search call; callers
+# add componentKeys, ps and p on top of a copy
+_ISSUE_SEARCH_PARAMS = {
+    'statuses': 'OPEN,CONFIRMED',
+    's': 'CREATION_DATE',  # Sort by creation date
+    'asc': 'false',  # Descending order (newest first)
+    'additionalFields': '_none_'  # Skip rules/users/comments payload
+}
+
+_REGEX_METACHARS = set('\\^$.|?*+()[]{}')
+
+
+def _literal_query_prefix(pattern: str) -> Optional[str]:
+    """
+    Extract the leading literal characters of a RegExp pattern.
+
+    SonarQube's /api/projects/search accepts a `q` substring filter; a
+    literal prefix of the pattern (e.g. "MyProject" from "MyProject\\.")
+    lets the server pre-filter and shrink the paginated payload.
+
+    The prefix is only used when every match provably starts with it:
+    top-level alternation ("teamA|teamB") disables the filter entirely,
+    and a quantifier that makes the last literal optional ("abcd?",
+    "abcd*", "abcd{0,1}") drops that character from the prefix.
+
+    Args:
+        pattern: RegExp pattern supplied by the caller
+
+    Returns:
+        Literal prefix usable as a `q` filter, or None if too short
+    """
+    prefix_chars = []
+    for char in pattern:
+        if char in _REGEX_METACHARS:
+            if char == '|':
+                # Alternation: the other branches need not share the prefix
+                return None
+            if char in '?*{':
+                # The preceding literal may repeat zero times
+                prefix_chars = prefix_chars[:-1]
+            break
+        prefix_chars.append(char)
+
+    # SonarQube requires at least 3 characters for the q filter
+    prefix = ''.join(prefix_chars)
+    return prefix if len(prefix) >= 3 else None
 
 
 class SonarQubeClient:
     """Client for interacting with SonarQube API."""
 
-    def __init__(self, base_url: str, api_token: str):
+    def __init__(self, base_url: str, api_token: str, use_cache: bool = False, cache_ttl: int = 300):
         """
         Initialize the SonarQube client.
 
         Args:
             base_url: Base URL of the SonarQube instance (e.g., https://sonarqube.example.com)
             api_token: API token for authentication
+            use_cache: Cache responses on disk so repeat runs skip unchanged
+                       payloads (requires the optional requests-cache
+                       package; silently ignored without it)
+            cache_ttl: Cache expiry in seconds (default: 300)
         """
         self.base_url = base_url.rstrip('/')
         self.auth = HTTPBasicAuth(api_token, '')
-        self.session = requests.Session()
+        if use_cache and CachedSession is not None:
+            self.session = CachedSession(
+                '.sonarqube_cache',
+                backend='sqlite',
+                expire_after=cache_ttl,
+                stale_if_error=True,
+            )
+        else:
+            self.session = requests.Session()
         self.session.auth = self.auth
+        # Size the connection pool for concurrent per-project fetches and
+        # retry transient server errors with backoff instead of aborting
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'Accept': 'application/json',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive',
+        })
+        # Endpoint URLs are fixed per instance; build them once
+        self._analyses_url = f"{self.base_url}/api/project_analyses/search"
+        self._projects_url = f"{self.base_url}/api/projects/search"
+        self._issues_url = f"{self.base_url}/api/issues/search"
+        # In-process memo for analysis dates: repeat lookups within one run
+        # (e.g. multi-language reports) become dict hits instead of requests
+        self._analysis_cache: Dict[str, Optional[str]] = {}
 
     def get_last_analysis_date(self, project_key: str) -> Optional[str]:
         """
         Fetch the last analysis date for a project.
 
+        Results are memoized per client instance, so asking twice for the
+        same project performs a single HTTP request.
+
         Args:
             project_key: The project key in SonarQube
 
         Returns:
             Last analysis date as a string, or None if not available
         """
-        endpoint = f"{self.base_url}/api/project_analyses/search"
+        if project_key in self._analysis_cache:
+            return self._analysis_cache[project_key]
+
+        endpoint = self._analyses_url
         params = {
             'project': project_key,
             'ps': 1  # Page size: limit to 1 (most recent)
         }
 
         try:
-            response = self.session.get(endpoint, params=params, timeout=30)
+            response = self.session.get(endpoint, params=params, timeout=_REQUEST_TIMEOUT)
             response.raise_for_status()
-            data = response.json()
+            data = _parse_json(response)
 
             analyses = data.get('analyses', [])
-            if analyses:
-                # Return the date of the most recent analysis
-                return analyses[0].get('date')
-            return None
+            # Date of the most recent analysis, or None when never analysed
+            date = analyses[0].get('date') if analyses else None
+            self._analysis_cache[project_key] = date
+            return date
 
         except requests.exceptions.RequestException as e:
             print(f"Error fetching analysis date for {project_key}: {e}", file=sys.stderr)
+            # Errors are not cached so a later retry can still succeed
             return None
 
     def get_projects(self, pattern: Optional[str] = None) -> List[str]:
@@ -77,45 +348,55 @@ class SonarQubeClient:
         Returns:
             List of project keys matching the pattern
         """
-        endpoint = f"{self.base_url}/api/projects/search"
-        all_projects = []
-        page = 1
+        endpoint = self._projects_url
+        projects = []
         page_size = 100
 
-        try:
-            while True:
-                params = {'ps': page_size, 'p': page}
-                response = self.session.get(endpoint, params=params, timeout=30)
-                response.raise_for_status()
-                data = response.json()
+        regex = re.compile(pattern) if pattern else None
+        # Push a literal prefix of the pattern to the server as a substring
+        # filter so pages only contain candidate keys
+        query = _literal_query_prefix(pattern) if pattern else None
 
-                components = data.get('components', [])
-                if not components:
-                    break
+        def fetch_page(page: int) -> Dict:
+            params = {'ps': page_size, 'p': page}
+            if query:
+                params['q'] = query
+            response = self.session.get(endpoint, params=params, timeout=_REQUEST_TIMEOUT)
+            response.raise_for_status()
+            return _parse_json(response)
 
-                all_projects.extend([comp['key'] for comp in components])
+        def collect(components: List[Dict]) -> None:
+            # Filter during pagination instead of collecting everything first
+            if regex:
+                projects.extend(comp['key'] for comp in components if regex.match(comp['key']))
+            else:
+                projects.extend(comp['key'] for comp in components)
 
-                # Check if there are more pages
-                paging = data.get('paging', {})
-                if page * page_size >= paging.get('total', 0):
-                    break
-                page += 1
+        try:
+            # The first page reveals paging.total, giving a known page count
+            data = fetch_page(1)
+            collect(data.get('components', []))
 
-            # Filter by pattern if provided
-            if pattern:
-                regex = re.compile(pattern)
-                filtered_projects = [proj for proj in all_projects if regex.match(proj)]
-                print(f"Found {len(filtered_projects)} projects matching pattern '{pattern}'", file=sys.stderr)
-                return filtered_projects
+            total = data.get('paging', {}).get('total', 0)
+            total_pages = (total + page_size - 1) // page_size
+
+            if total_pages > 1:
+                # Remaining pages are independent; fetch them concurrently
+                with ThreadPoolExecutor(max_workers=min(8, total_pages - 1)) as executor:
+                    for page_data in executor.map(fetch_page, range(2, total_pages + 1)):
+                        collect(page_data.get('components', []))
 
-            print(f"Found {len(all_projects)} total projects", file=sys.stderr)
-            return all_projects
+            if pattern:
+                print(f"Found {len(projects)} projects matching pattern '{pattern}'", file=sys.stderr)
+            else:
+                print(f"Found {len(projects)} total projects", file=sys.stderr)
+            return projects
 
         except requests.exceptions.RequestException as e:
             print(f"Error fetching projects: {e}", file=sys.stderr)
             return []
 
-    def get_latest_issues(self, project_key: str, max_issues: int = 10) -> List[Dict]:
+    def get_latest_issues(self, project_key: str, max_issues: int = 10) -> List[IssueRecord]:
         """
         Fetch the latest open issues for a project.
 
@@ -126,28 +407,37 @@ class SonarQubeClient:
         Returns:
             List of issue dictionaries containing severity, message, component, and line
         """
-        endpoint = f"{self.base_url}/api/issues/search"
-        params = {
-            'componentKeys': project_key,
-            'statuses': 'OPEN,CONFIRMED',
-            'ps': max_issues,  # Page size
-            's': 'CREATION_DATE',  # Sort by creation date
-            'asc': 'false'  # Descending order (newest first)
-        }
+        endpoint = self._issues_url
+        # SonarQube caps ps at 500; larger limits need true pagination
+        page_size = min(500, max_issues)
+        params = dict(_ISSUE_SEARCH_PARAMS, componentKeys=project_key, ps=page_size)
+
+        def fetch_page(page: int) -> List[IssueRecord]:
+            params['p'] = page
+            if ijson is not None:
+                # Stream-parse: extract the four needed fields per issue
+                # without materializing the full response dict tree
+                response = self.session.get(endpoint, params=params, timeout=_REQUEST_TIMEOUT, stream=True)
+                response.raise_for_status()
+                response.raw.decode_content = True  # Transparent gzip handling
+                return [IssueRecord.from_api(issue) for issue in ijson.items(response.raw, 'issues.item')]
 
-        try:
-            response = self.session.get(endpoint, params=params, timeout=30)
+            response = self.session.get(endpoint, params=params, timeout=_REQUEST_TIMEOUT)
             response.raise_for_status()
-            data = response.json()
+            data = _parse_json(response)
+            return [IssueRecord.from_api(issue) for issue in data.get('issues', ())]
 
-            issues = []
-            for issue in data.get('issues', []):
-                issues.append({
-                    'severity': issue.get('severity', 'N/A'),
-                    'message': issue.get('message', 'N/A'),
-                    'component': issue.get('component', 'N/A'),
-                    'line': issue.get('line', 'N/A')
-                })
+        issues: List[IssueRecord] = []
+        try:
+            page = 1
+            while True:
+                page_issues = fetch_page(page)
+                issues.extend(page_issues[:max_issues - len(issues)])
+
+                # A short page means the server has no more issues
+                if len(issues) >= max_issues or len(page_issues) < page_size:
+                    break
+                page += 1
 
             return issues
 
@@ -155,10 +445,79 @@ class SonarQubeClient:
             print(f"Error fetching issues for {project_key}: {e}", file=sys.stderr)
             return []
 
+    def get_latest_issues_bulk(self, project_keys: List[str], max_issues_per_project: int = 10) -> Dict[str, List[IssueRecord]]:
+        """
+        Fetch the latest open issues for several projects in a single query.
+
+        SonarQube's componentKeys parameter accepts comma-separated project
+        keys, so one paginated request replaces one request per project.
+
+        Args:
+            project_keys: List of project keys in SonarQube
+            max_issues_per_project: Maximum number of issues to keep per project (default: 10)
+
+        Returns:
+            Dictionary mapping each project key to its list of issue dictionaries
+        """
+        if not project_keys:
+            return {}
+
+        endpoint = self._issues_url
+        issues_by_project: Dict[str, List[IssueRecord]] = {key: [] for key in project_keys}
+        page = 1
+        # No page needs more rows than the combined per-project caps
+        page_size = min(500, len(project_keys) * max_issues_per_project)
+
+        params = dict(_ISSUE_SEARCH_PARAMS, componentKeys=','.join(project_keys), ps=page_size)
+
+        try:
+            while True:
+                params['p'] = page
+                response = self.session.get(endpoint, params=params, timeout=_REQUEST_TIMEOUT)
+                response.raise_for_status()
+                data = _parse_json(response)
+
+                issues = data.get('issues', [])
+                for issue in issues:
+                    # Issues arrive newest-first, so each bucket fills with the
+                    # latest issues and can simply stop at the cap
+                    bucket = issues_by_project.get(issue.get('project'))
+                    if bucket is None or len(bucket) >= max_issues_per_project:
+                        continue
+                    bucket.append(IssueRecord.from_api(issue))
+
+                if all(len(bucket) >= max_issues_per_project for bucket in issues_by_project.values()):
+                    break
+
+                paging = data.get('paging', {})
+                if page * page_size >= paging.get('total', 0):
+                    break
+                if page >= 10000 // page_size:
+                    # SonarQube rejects requests past the 10 000th result; a
+                    # quiet project whose newest issues sit deeper in the
+                    # merged stream needs its own query instead
+                    for project_key, bucket in issues_by_project.items():
+                        if len(bucket) < max_issues_per_project:
+                            issues_by_project[project_key] = self.get_latest_issues(
+                                project_key, max_issues_per_project
+                            )
+                    break
+                page += 1
+
+            return issues_by_project
+
+        except requests.exceptions.RequestException as e:
+            print(f"Error fetching issues for {', '.join(project_keys)}: {e}", file=sys.stderr)
+            return issues_by_project
+
 
 class MarkdownReportGenerator:
     """Generator for Markdown reports with i18n support."""
 
+    # No per-instance __dict__; tests and behave scenarios create many
+    # short-lived generators
+    __slots__ = ('language', 'labels', '_table_header')
+
     def __init__(self, language: str = 'en'):
         """
         Initialize the report generator with a specific language.
@@ -167,6 +526,15 @@ class MarkdownReportGenerator:
             language: Language code ('en' or 'ru'), default: 'en'
         """
         self.language = language if language in ['en', 'ru'] else 'en'
+        # Resolve all labels once; report generation then avoids per-row
+        # translation lookups.
+        self.labels = get_all_translations(self.language)
+        # Header and separator are identical for every table in a report
+        self._table_header = (
+            f"| {self.labels['severity']} | {self.labels['message']} "
+            f"| {self.labels['component']} | {self.labels['line']} |\n"
+            "|----------|---------|-----------|------|"
+        )
 
     def format_analysis_date(self, date_str: Optional[str]) -> str:
         """
@@ -179,12 +547,16 @@ class MarkdownReportGenerator:
             Formatted date string
         """
         if not date_str:
-            return get_translation('no_analysis_available', self.language)
+            return self.labels['no_analysis_available']
+
+        # Cheap shape check: skip the exception machinery for values that
+        # cannot be ISO dates (e.g. already-formatted legacy strings)
+        if len(date_str) < 19 or date_str[4] != '-' or date_str[7] != '-':
+            return date_str
 
         try:
-            # Parse ISO format date and format it nicely
-            dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-            return dt.strftime('%Y-%m-%d %H:%M:%S UTC')
+            # Parse ISO format date and format it nicely (memoized)
+            return _format_iso_date(date_str)
         except (ValueError, AttributeError):
             return date_str
 
@@ -199,72 +571,95 @@ class MarkdownReportGenerator:
             Markdown formatted table as a string
         """
         if not issues:
-            return get_translation('no_open_issues', self.language)
+            return self.labels['no_open_issues']
 
-        # Create table header with translations
-        severity_col = get_translation('severity', self.language)
-        message_col = get_translation('message', self.language)
-        component_col = get_translation('component', self.language)
-        line_col = get_translation('line', self.language)
-
-        table = f"| {severity_col} | {message_col} | {component_col} | {line_col} |\n"
-        table += "|----------|---------|-----------|------|\n"
+        # Header and separator are precomputed in __init__
+        rows = [self._table_header]
 
         # Add rows for each issue
         for issue in issues:
             severity = issue.get('severity', 'N/A')
-            message = issue.get('message', 'N/A').replace('|', '\\|')  # Escape pipes
-            component = issue.get('component', 'N/A').replace('|', '\\|')
-            line = str(issue.get('line', 'N/A'))
+            message = issue.get('message', 'N/A').translate(_PIPE_ESCAPE)  # Escape pipes
+            component = issue.get('component', 'N/A').translate(_PIPE_ESCAPE)
 
-            table += f"| {severity} | {message} | {component} | {line} |\n"
+            # The f-string formats int/str line values directly; no str() needed
+            rows.append(f"| {severity} | {message} | {component} | {issue.get('line', 'N/A')} |")
 
-        return table
+        return '\n'.join(rows) + '\n'
 
-    def generate_report(self, projects_data: List[Dict]) -> str:
+    def iter_report(self, projects_data: List[Dict]):
         """
-        Generate a complete Markdown report.
+        Yield the Markdown report section by section.
+
+        Streaming keeps memory constant for large reports: callers can write
+        fragments to a file as they are produced instead of materializing
+        the whole report first.
 
         Args:
             projects_data: List of dictionaries containing project data
                           Each dict should have 'project_key', 'last_analysis', and 'issues'
 
-        Returns:
-            Complete Markdown report as a string
+        Yields:
+            Markdown report fragments as strings
         """
-        report_title = get_translation('report_title', self.language)
-        generated_label = get_translation('generated', self.language)
-        project_label = get_translation('project', self.language)
-        last_analysis_label = get_translation('last_analysis', self.language)
-        latest_issues_label = get_translation('latest_issues', self.language)
+        report_title = self.labels['report_title']
+        generated_label = self.labels['generated']
+        project_label = self.labels['project']
+        last_analysis_label = self.labels['last_analysis']
+        latest_issues_label = self.labels['latest_issues']
 
-        report = f"# {report_title}\n\n"
-        report += f"{generated_label}: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-        report += "---\n\n"
+        yield f"# {report_title}\n\n"
+        yield f"{generated_label}: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+        yield "---\n\n"
 
         for project in projects_data:
             project_key = project.get('project_key', 'Unknown')
             last_analysis = project.get('last_analysis')
             issues = project.get('issues', [])
 
-            report += f"## {project_label}: {project_key}\n\n"
+            yield f"## {project_label}: {project_key}\n\n"
 
             # Add last analysis date
             formatted_date = self.format_analysis_date(last_analysis)
-            report += f"**{last_analysis_label}:** {formatted_date}\n\n"
+            yield f"**{last_analysis_label}:** {formatted_date}\n\n"
 
             # Add issues section
-            report += f"**{latest_issues_label}:**\n\n"
-            report += self.generate_issues_table(issues)
-            report += "\n\n---\n\n"
+            yield f"**{latest_issues_label}:**\n\n"
+            yield self.generate_issues_table(issues)
+            yield "\n\n---\n\n"
+
+    def write_report(self, projects_data: List[Dict], file) -> None:
+        """
+        Write the Markdown report incrementally to an open file object.
+
+        Args:
+            projects_data: List of dictionaries containing project data
+                          Each dict should have 'project_key', 'last_analysis', and 'issues'
+            file: Writable text file object (e.g. an open file or sys.stdout)
+        """
+        file.writelines(self.iter_report(projects_data))
 
-        return report
+    def generate_report(self, projects_data: List[Dict]) -> str:
+        """
+        Generate a complete Markdown report.
+
+        Args:
+            projects_data: List of dictionaries containing project data
+                          Each dict should have 'project_key', 'last_analysis', and 'issues'
+
+        Returns:
+            Complete Markdown report as a string
+        """
+        return ''.join(self.iter_report(projects_data))
 
 
 def main():
     """Main entry point for the SonarQube Checker tool."""
-    # Load environment variables from .env file if it exists
-    load_dotenv()
+    # Load environment variables from .env file if it exists; the import is
+    # deferred so invocations without a .env skip python-dotenv entirely
+    if os.path.exists('.env'):
+        from dotenv import load_dotenv
+        load_dotenv()
 
     parser = argparse.ArgumentParser(
         description='Fetch SonarQube project analysis data and generate a Markdown report.',
@@ -281,7 +676,6 @@ Examples:
 
     parser.add_argument(
         '--url',
-        default=os.getenv('SONARQUBE_URL'),
         help=(
             'SonarQube base URL (e.g., https://sonarqube.example.com). '
             'Can be set via SONARQUBE_URL environment variable.'
@@ -290,7 +684,6 @@ Examples:
 
     parser.add_argument(
         '--token',
-        default=os.getenv('SONARQUBE_TOKEN'),
         help=(
             'SonarQube API token for authentication. '
             'Can be set via SONARQUBE_TOKEN environment variable.'
@@ -299,7 +692,6 @@ Examples:
 
     parser.add_argument(
         '--projects',
-        default=os.getenv('SONARQUBE_PROJECTS'),
         help=(
             'Comma-separated list of project keys (e.g., project1,project2). '
             'Can be set via SONARQUBE_PROJECTS environment variable. '
@@ -309,7 +701,6 @@ Examples:
 
     parser.add_argument(
         '--project-pattern',
-        default=os.getenv('SONARQUBE_PROJECT_PATTERN'),
         help=(
             'RegExp pattern to auto-discover projects (e.g., "MyProject\\."). '
             'Can be set via SONARQUBE_PROJECT_PATTERN environment variable. '
@@ -320,13 +711,48 @@ Examples:
     parser.add_argument(
         '--max-issues',
         type=int,
-        default=int(os.getenv('SONARQUBE_MAX_ISSUES', '10')),
         help=(
             'Maximum number of issues to fetch per project (default: 10). '
             'Can be set via SONARQUBE_MAX_ISSUES environment variable.'
         ),
     )
 
+    parser.add_argument(
+        '--max-parallel',
+        type=int,
+        help=(
+            'Maximum number of concurrent API requests (default: 8). '
+            'Can be set via SONARQUBE_MAX_PARALLEL environment variable.'
+        ),
+    )
+
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help=(
+            'Refetch issues even for projects whose last analysis date is '
+            'unchanged since the previous run.'
+        ),
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help=(
+            'Disable the on-disk HTTP response cache (used only when the '
+            'optional requests-cache package is installed).'
+        ),
+    )
+
+    parser.add_argument(
+        '--cache-ttl',
+        type=int,
+        help=(
+            'Expiry of the on-disk HTTP response cache in seconds (default: 300). '
+            'Can be set via SONARQUBE_CACHE_TTL environment variable.'
+        ),
+    )
+
     parser.add_argument(
         '--output',
         help='Output file path (e.g., report.md). If not specified, prints to console.',
@@ -334,7 +760,6 @@ Examples:
 
     parser.add_argument(
         '--language',
-        default=os.getenv('SONARQUBE_REPORT_LANGUAGE', 'en'),
         choices=['en', 'ru'],
         help=(
             'Report language (en or ru, default: en). '
@@ -344,6 +769,20 @@ Examples:
 
     args = parser.parse_args()
 
+    # Resolve environment-variable defaults only after parsing, so --help
+    # and argument errors never touch the environment
+    args.url = args.url or os.getenv('SONARQUBE_URL')
+    args.token = args.token or os.getenv('SONARQUBE_TOKEN')
+    args.projects = args.projects or os.getenv('SONARQUBE_PROJECTS')
+    args.project_pattern = args.project_pattern or os.getenv('SONARQUBE_PROJECT_PATTERN')
+    if args.max_issues is None:
+        args.max_issues = int(os.getenv('SONARQUBE_MAX_ISSUES', '10'))
+    if args.max_parallel is None:
+        args.max_parallel = int(os.getenv('SONARQUBE_MAX_PARALLEL', '8'))
+    if args.cache_ttl is None:
+        args.cache_ttl = int(os.getenv('SONARQUBE_CACHE_TTL', '300'))
+    args.language = args.language or os.getenv('SONARQUBE_REPORT_LANGUAGE', 'en')
+
     # Validate required arguments
     if not args.url:
         print(
@@ -360,12 +799,19 @@ Examples:
         sys.exit(1)
 
     # Initialize SonarQube client
-    client = SonarQubeClient(args.url, args.token)
+    client = SonarQubeClient(args.url, args.token, use_cache=not args.no_cache, cache_ttl=args.cache_ttl)
 
     # Determine project keys
     if args.projects:
-        # Parse project keys from argument
-        project_keys = [key.strip() for key in args.projects.split(',')]
+        # Parse project keys from argument, dropping duplicates while
+        # keeping first-seen order so no project is fetched (or reported) twice
+        raw_keys = [key.strip() for key in args.projects.split(',')]
+        project_keys = list(dict.fromkeys(raw_keys))
+        if len(project_keys) != len(raw_keys):
+            print(
+                f"Warning: removed {len(raw_keys) - len(project_keys)} duplicate project key(s)",
+                file=sys.stderr,
+            )
     elif args.project_pattern:
         # Auto-discover projects using RegExp pattern
         print(f"Auto-discovering projects matching pattern: {args.project_pattern}", file=sys.stderr)
@@ -385,35 +831,72 @@ Examples:
         )
         sys.exit(1)
 
-    # Fetch data for each project
-    projects_data = []
-    for project_key in project_keys:
+    # Fetch analysis dates concurrently (I/O bound: one HTTP call per project)
+    def fetch_analysis_date(project_key: str) -> Optional[str]:
         print(f"Fetching data for project: {project_key}...", file=sys.stderr)
-
-        last_analysis = client.get_last_analysis_date(project_key)
-        issues = client.get_latest_issues(project_key, args.max_issues)
-
-        projects_data.append({
+        return client.get_last_analysis_date(project_key)
+
+    state = {} if args.force else _load_report_state()
+
+    max_workers = max(1, min(args.max_parallel, len(project_keys)))
+    if state:
+        # With prior state, dates must land first so unchanged projects can
+        # skip the issues fetch altogether
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # executor.map preserves the order of project_keys in the report
+            analysis_dates = list(executor.map(fetch_analysis_date, project_keys))
+
+        issues_by_project = {}
+        stale_keys = []
+        for project_key, last_analysis in zip(project_keys, analysis_dates):
+            entry = state.get(project_key)
+            if entry and last_analysis and entry.get('last_analysis') == last_analysis:
+                issues_by_project[project_key] = entry.get('issues', [])
+            else:
+                stale_keys.append(project_key)
+
+        if stale_keys:
+            issues_by_project.update(client.get_latest_issues_bulk(stale_keys, args.max_issues))
+    else:
+        # One extra worker lets the bulk issues query run while the analysis
+        # dates stream in, instead of serializing the two phases
+        with ThreadPoolExecutor(max_workers=max_workers + 1) as executor:
+            issues_future = executor.submit(client.get_latest_issues_bulk, project_keys, args.max_issues)
+            # executor.map preserves the order of project_keys in the report
+            analysis_dates = list(executor.map(fetch_analysis_date, project_keys))
+            issues_by_project = issues_future.result()
+
+    projects_data = [
+        {
             'project_key': project_key,
             'last_analysis': last_analysis,
-            'issues': issues
-        })
+            'issues': issues_by_project.get(project_key, [])
+        }
+        for project_key, last_analysis in zip(project_keys, analysis_dates)
+    ]
+
+    _save_report_state({
+        project['project_key']: {
+            'last_analysis': project['last_analysis'],
+            'issues': project['issues'],
+        }
+        for project in projects_data
+    })
 
     # Generate Markdown report with selected language
     generator = MarkdownReportGenerator(language=args.language)
-    report = generator.generate_report(projects_data)
 
-    # Output the report
+    # Output the report, streaming sections instead of building one big string
     if args.output:
         try:
             with open(args.output, 'w', encoding='utf-8') as f:
-                f.write(report)
+                generator.write_report(projects_data, f)
             print(f"Report saved to: {args.output}", file=sys.stderr)
         except IOError as e:
             print(f"Error writing to file: {e}", file=sys.stderr)
             sys.exit(1)
     else:
-        print(report)
+        generator.write_report(projects_data, sys.stdout)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,11 @@
+"""Shared pytest configuration for the test suite.
+
+Puts the project root on sys.path once, so the test modules can import
+sonarqube_checker and i18n without per-file path manipulation even when
+the package is not installed.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -9,9 +9,6 @@ import sys
 
 import pytest
 
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
 from i18n import TRANSLATIONS, get_all_translations, get_translation
 
 
@@ -96,6 +93,41 @@ class TestI18n:
         # Should return the exact same object (cached)
         assert result1 is result2
 
+    def test_import_does_not_load_translations(self):
+        """Importing i18n must not read the YAML file; first access does."""
+        import subprocess
+
+        script = (
+            'import i18n, sys; '
+            'sys.exit(0 if i18n._TRANSLATIONS_CACHE is None else 1)'
+        )
+        result = subprocess.run(
+            [sys.executable, '-c', script],
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        )
+        assert result.returncode == 0
+
+    def test_json_sidecar_cache_round_trip(self, tmp_path, monkeypatch):
+        """A valid JSON sidecar cache should be used instead of parsing YAML."""
+        from i18n import _read_json_cache, _write_json_cache
+
+        cache_file = str(tmp_path / 'translations.yaml.cache.json')
+        data = {'en': {'report_title': 'Cached Title'}}
+
+        _write_json_cache(cache_file, 123.0, 456, data)
+        assert _read_json_cache(cache_file, 123.0, 456) == data
+
+    def test_json_sidecar_cache_stale(self, tmp_path):
+        """A cache whose (mtime, size) does not match must be ignored."""
+        from i18n import _read_json_cache, _write_json_cache
+
+        cache_file = str(tmp_path / 'translations.yaml.cache.json')
+        _write_json_cache(cache_file, 123.0, 456, {'en': {}})
+
+        assert _read_json_cache(cache_file, 999.0, 456) is None
+        assert _read_json_cache(cache_file, 123.0, 1) is None
+        assert _read_json_cache(str(tmp_path / 'missing.json'), 123.0, 456) is None
+
     def test_load_translations_fallback(self, monkeypatch):
         """Reloading the module with a missing file should use built-in defaults."""
         import builtins
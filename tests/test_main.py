@@ -13,8 +13,10 @@ import sonarqube_checker
 
 
 @pytest.fixture(autouse=True)
-def reset_env(monkeypatch):
-    """Ensure environment variables used by argparse defaults do not leak between tests."""
+def reset_env(monkeypatch, tmp_path):
+    """Isolate tests from the environment and from state files of other tests."""
+    # Run each test in its own directory so .sonar_state.json cannot leak
+    monkeypatch.chdir(tmp_path)
     for env_var in [
         'SONARQUBE_URL',
         'SONARQUBE_TOKEN',
@@ -28,7 +30,7 @@ def reset_env(monkeypatch):
 def _run_main(argv, monkeypatch):
     """Helper to execute main() with patched argv and captured I/O."""
     monkeypatch.setattr(sys, 'argv', argv)
-    monkeypatch.setattr(sonarqube_checker, 'load_dotenv', lambda: None)
+    monkeypatch.setattr('dotenv.load_dotenv', lambda *args, **kwargs: None)
     stdout = io.StringIO()
     stderr = io.StringIO()
     with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
@@ -40,14 +42,16 @@ def test_main_prints_russian_report(monkeypatch):
     """Running the CLI with Russian language prints translated report text."""
     mock_client = MagicMock()
     mock_client.get_last_analysis_date.return_value = '2024-02-01T00:00:00+0000'
-    mock_client.get_latest_issues.return_value = [
-        {
-            'severity': 'MAJOR',
-            'message': 'Issue details',
-            'component': 'project:file.py',
-            'line': 12,
-        }
-    ]
+    mock_client.get_latest_issues_bulk.return_value = {
+        'project-key': [
+            {
+                'severity': 'MAJOR',
+                'message': 'Issue details',
+                'component': 'project:file.py',
+                'line': 12,
+            }
+        ]
+    }
     monkeypatch.setattr(sonarqube_checker, 'SonarQubeClient', MagicMock(return_value=mock_client))
 
     stdout, stderr = _run_main(
@@ -66,11 +70,76 @@ def test_main_prints_russian_report(monkeypatch):
     assert 'Fetching data for project: project-key' in stderr
 
 
+def test_main_deduplicates_project_keys(monkeypatch):
+    """Duplicate keys in --projects must be fetched and reported only once."""
+    mock_client = MagicMock()
+    mock_client.get_last_analysis_date.return_value = '2024-02-01T00:00:00+0000'
+    mock_client.get_latest_issues_bulk.return_value = {'project-key': []}
+    monkeypatch.setattr(sonarqube_checker, 'SonarQubeClient', MagicMock(return_value=mock_client))
+
+    stdout, stderr = _run_main(
+        [
+            'sonarqube_checker.py',
+            '--url', 'https://example.com',
+            '--token', 'token',
+            '--projects', 'project-key, project-key ,project-key',
+        ],
+        monkeypatch,
+    )
+
+    assert mock_client.get_last_analysis_date.call_count == 1
+    assert stdout.count('project-key') == 1
+    assert 'removed 2 duplicate project key(s)' in stderr
+
+
+def test_main_skips_issue_fetch_for_unchanged_projects(monkeypatch):
+    """A matching last_analysis in the state file must reuse cached issues."""
+    cached_issue = {
+        'severity': 'MINOR',
+        'message': 'Cached issue',
+        'component': 'project:file.py',
+        'line': 7,
+    }
+    sonarqube_checker._save_report_state({
+        'project-key': {
+            'last_analysis': '2024-02-01T00:00:00+0000',
+            'issues': [cached_issue],
+        }
+    })
+
+    mock_client = MagicMock()
+    mock_client.get_last_analysis_date.return_value = '2024-02-01T00:00:00+0000'
+    monkeypatch.setattr(sonarqube_checker, 'SonarQubeClient', MagicMock(return_value=mock_client))
+
+    stdout, _ = _run_main(
+        [
+            'sonarqube_checker.py',
+            '--url', 'https://example.com',
+            '--token', 'token',
+            '--projects', 'project-key',
+        ],
+        monkeypatch,
+    )
+
+    mock_client.get_latest_issues_bulk.assert_not_called()
+    assert 'Cached issue' in stdout
+
+
+def test_report_state_round_trip(tmp_path):
+    """State helpers must persist and reload project data faithfully."""
+    path = str(tmp_path / '.sonar_state.json')
+    state = {'proj': {'last_analysis': '2024-01-01T00:00:00+0000', 'issues': []}}
+
+    sonarqube_checker._save_report_state(state, path)
+    assert sonarqube_checker._load_report_state(path) == state
+    assert sonarqube_checker._load_report_state(str(tmp_path / 'missing.json')) == {}
+
+
 def test_main_writes_output_file(monkeypatch, tmp_path):
     """CLI should write the report to a file when --output is provided."""
     mock_client = MagicMock()
     mock_client.get_last_analysis_date.return_value = '2024-02-01T00:00:00+0000'
-    mock_client.get_latest_issues.return_value = []
+    mock_client.get_latest_issues_bulk.return_value = {'project-key': []}
     monkeypatch.setattr(sonarqube_checker, 'SonarQubeClient', MagicMock(return_value=mock_client))
 
     output_path = tmp_path / 'report.md'
@@ -95,7 +164,7 @@ def test_main_handles_file_write_error(monkeypatch, tmp_path):
     """If writing fails the CLI should exit with an informative error."""
     mock_client = MagicMock()
     mock_client.get_last_analysis_date.return_value = None
-    mock_client.get_latest_issues.return_value = []
+    mock_client.get_latest_issues_bulk.return_value = {'project-key': []}
     monkeypatch.setattr(sonarqube_checker, 'SonarQubeClient', MagicMock(return_value=mock_client))
 
     impossible_path = tmp_path / 'dir' / 'report.md'
@@ -141,7 +210,7 @@ def test_main_missing_required_arguments(monkeypatch, missing_flag, expected_mes
     stdout = io.StringIO()
     stderr = io.StringIO()
     with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
-        monkeypatch.setattr(sonarqube_checker, 'load_dotenv', lambda: None)
+        monkeypatch.setattr('dotenv.load_dotenv', lambda *args, **kwargs: None)
         with pytest.raises(SystemExit) as exc:
             sonarqube_checker.main()
 
@@ -156,6 +225,11 @@ def test_module_entrypoint_calls_main(monkeypatch, capsys):
         def __init__(self, payload):
             self._payload = payload
 
+        @property
+        def content(self):
+            import json
+            return json.dumps(self._payload).encode('utf-8')
+
         def raise_for_status(self):  # pragma: no cover - nothing to do
             return None
 
@@ -165,6 +239,10 @@ def test_module_entrypoint_calls_main(monkeypatch, capsys):
     class DummySession:
         def __init__(self):
             self.auth = None
+            self.headers = {}
+
+        def mount(self, prefix, adapter):  # pragma: no cover - nothing to do
+            return None
 
         def get(self, endpoint, params=None, timeout=30):
             if 'project_analyses' in endpoint:
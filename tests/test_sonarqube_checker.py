@@ -4,41 +4,35 @@ Test script for SonarQube Checker functionality.
 This tests the core functions without requiring a live SonarQube instance.
 """
 
-import os
-import sys
-
-# Add the parent directory to the path to import sonarqube_checker
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
-from sonarqube_checker import MarkdownReportGenerator  # pylint: disable=wrong-import-position
-
-
-def test_format_analysis_date():
-    """Test date formatting function."""
-    print("Testing format_analysis_date...")
-
-    # Test with valid ISO date
-    date1 = "2024-01-15T12:00:00+0000"
-    generator = MarkdownReportGenerator()
-    result1 = generator.format_analysis_date(date1)
-    print(f"  Input: {date1}")
-    print(f"  Output: {result1}")
-    assert "2024-01-15" in result1, "Date formatting failed"
-
-    # Test with None
-    result2 = generator.format_analysis_date(None)
-    print("  Input: None")
-    print(f"  Output: {result2}")
-    assert result2 == "⚠️ No analysis available", "None handling failed"
-
-    print("✓ format_analysis_date tests passed\n")
-
-
-def test_generate_issues_table():
-    """Test issues table generation."""
-    print("Testing generate_issues_table...")
-
-    # Test with issues
+import pytest
+
+from sonarqube_checker import MarkdownReportGenerator
+
+
+@pytest.mark.parametrize(
+    'language, expected_no_analysis',
+    [
+        ('en', '⚠️ No analysis available'),
+        ('ru', '⚠️ Анализ недоступен'),
+    ],
+)
+def test_format_analysis_date(language, expected_no_analysis):
+    """Valid dates are formatted and None maps to the translated fallback."""
+    generator = MarkdownReportGenerator(language=language)
+
+    assert '2024-01-15' in generator.format_analysis_date('2024-01-15T12:00:00+0000')
+    assert generator.format_analysis_date(None) == expected_no_analysis
+
+
+@pytest.mark.parametrize(
+    'language, expected_header, expected_empty',
+    [
+        ('en', '| 🔥 Severity | 💬 Message | 🧩 Component | 📍 Line |', '✅ No open issues found.'),
+        ('ru', '| 🔥 Важность | 💬 Сообщение | 🧩 Компонент | 📍 Строка |', '✅ Открытых проблем не найдено.'),
+    ],
+)
+def test_generate_issues_table(language, expected_header, expected_empty):
+    """Issue tables carry the translated header and render every issue."""
     issues = [
         {
             'severity': 'MAJOR',
@@ -54,26 +48,19 @@ def test_generate_issues_table():
         }
     ]
 
-    generator = MarkdownReportGenerator()
+    generator = MarkdownReportGenerator(language=language)
     result = generator.generate_issues_table(issues)
-    print(f"  Generated table:\n{result}")
-    assert "| 🔥 Severity | 💬 Message | 🧩 Component | 📍 Line |" in result, "Table header missing"
-    assert "MAJOR" in result, "Issue severity missing"
-    assert "Remove unused variable" in result, "Issue message missing"
+    assert expected_header in result
+    assert 'MAJOR' in result
+    assert 'Remove unused variable' in result
 
-    # Test with empty issues
-    result_empty = generator.generate_issues_table([])
-    print(f"  Empty issues result: {result_empty}")
-    assert "✅ No open issues found." in result_empty, "Empty issues handling failed"
+    assert expected_empty in generator.generate_issues_table([])
 
-    print("✓ generate_issues_table tests passed\n")
 
-
-def test_generate_report():
-    """Test full report generation."""
-    print("Testing generate_report...")
-
-    projects_data = [
+@pytest.fixture(scope='module')
+def projects_data():
+    """One project with a single critical issue, shared by the report tests."""
+    return [
         {
             'project_key': 'test-project',
             'last_analysis': '2024-01-15T12:00:00+0000',
@@ -88,22 +75,29 @@ def test_generate_report():
         }
     ]
 
-    generator = MarkdownReportGenerator()
-    report = generator.generate_report(projects_data)
-    print(f"  Generated report (first 500 chars):\n{report[:500]}...")
 
-    assert "# 📊 SonarQube Analysis Report" in report, "Report title missing"
-    assert "test-project" in report, "Project key missing"
-    assert "CRITICAL" in report, "Issue severity missing"
-    assert "Security vulnerability detected" in report, "Issue message missing"
+@pytest.mark.parametrize(
+    'language, expected_title, expected_labels',
+    [
+        ('en', '# 📊 SonarQube Analysis Report', ('🕒 Generated:', '📁 Project:')),
+        ('ru', '# 📊 Отчёт анализа SonarQube', ('🕒 Создано:', '📁 Проект:')),
+    ],
+)
+def test_generate_report(projects_data, language, expected_title, expected_labels):
+    """Full reports carry the translated headings and render the issue data."""
+    generator = MarkdownReportGenerator(language=language)
+    report = generator.generate_report(projects_data)
 
-    print("✓ generate_report tests passed\n")
+    assert expected_title in report
+    for label in expected_labels:
+        assert label in report
+    assert 'test-project' in report
+    assert 'CRITICAL' in report
+    assert 'Security vulnerability detected' in report
 
 
 def test_pipe_escaping():
     """Test that pipe characters in messages are escaped."""
-    print("Testing pipe character escaping...")
-
     issues = [
         {
             'severity': 'MAJOR',
@@ -115,11 +109,24 @@ def test_pipe_escaping():
 
     generator = MarkdownReportGenerator()
     result = generator.generate_issues_table(issues)
-    has_escaped_pipe = '\\|' in result
-    print(f"  Result contains escaped pipe: {has_escaped_pipe}")
+
     assert '\\|' in result, "Pipe character not escaped"
 
-    print("✓ pipe_escaping test passed\n")
+
+def test_newline_normalization():
+    """Embedded newlines must not break Markdown table rows."""
+    issues = [
+        {
+            'severity': 'MAJOR',
+            'message': 'First line\nsecond line',
+            'component': 'project:file.py',
+            'line': 10
+        }
+    ]
+
+    generator = MarkdownReportGenerator()
+    result = generator.generate_issues_table(issues)
+    assert 'First line second line' in result
 
 
 def test_format_analysis_date_invalid_format():
@@ -134,57 +141,17 @@ def test_format_analysis_date_invalid_format():
     assert result == invalid_date
 
 
-def test_format_analysis_date_russian():
-    """Test date formatting with Russian language."""
-    generator = MarkdownReportGenerator(language='ru')
-
-    # Test with None (should use Russian translation)
-    result = generator.format_analysis_date(None)
-    assert result == "⚠️ Анализ недоступен"
-
-    # Test with valid date
-    date = "2024-01-15T12:00:00+0000"
-    result = generator.format_analysis_date(date)
-    assert "2024-01-15" in result
-
-
-def test_generate_issues_table_russian():
-    """Test issues table generation with Russian language."""
-    generator = MarkdownReportGenerator(language='ru')
-
-    # Test with empty issues
-    result = generator.generate_issues_table([])
-    assert "✅ Открытых проблем не найдено." in result
-
-    # Test with issues
-    issues = [
-        {
-            'severity': 'MAJOR',
-            'message': 'Test issue',
-            'component': 'project:file.py',
-            'line': 42
-        }
-    ]
-    result = generator.generate_issues_table(issues)
-    assert "| 🔥 Важность | 💬 Сообщение | 🧩 Компонент | 📍 Строка |" in result
-
+def test_iter_report_matches_generate_report(projects_data):
+    """Streaming fragments joined together must equal the full report."""
+    generator = MarkdownReportGenerator()
 
-def test_generate_report_russian():
-    """Test full report generation with Russian language."""
-    generator = MarkdownReportGenerator(language='ru')
+    import re
 
-    projects_data = [
-        {
-            'project_key': 'test-project',
-            'last_analysis': '2024-01-15T12:00:00+0000',
-            'issues': []
-        }
-    ]
+    def mask_timestamp(report):
+        return re.sub(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}', '<ts>', report)
 
-    report = generator.generate_report(projects_data)
-    assert "# 📊 Отчёт анализа SonarQube" in report
-    assert "🕒 Создано:" in report
-    assert "📁 Проект:" in report
+    streamed = ''.join(generator.iter_report(projects_data))
+    assert mask_timestamp(streamed) == mask_timestamp(generator.generate_report(projects_data))
 
 
 def test_markdown_report_generator_invalid_language():
@@ -198,22 +165,13 @@ def test_markdown_report_generator_invalid_language():
     assert result == "⚠️ No analysis available"
 
 
+def test_format_analysis_date_slice_fast_path_matches_parser():
+    """The slice fast path must agree with full ISO parsing for UTC shapes."""
+    generator = MarkdownReportGenerator()
+
+    for date in ('2024-01-15T12:00:00+0000', '2024-01-15T12:00:00+00:00', '2024-01-15T12:00:00Z'):
+        assert generator.format_analysis_date(date) == '2024-01-15 12:00:00 UTC'
+
+
 if __name__ == '__main__':
-    print("=" * 60)
-    print("Running SonarQube Checker Tests")
-    print("=" * 60 + "\n")
-
-    try:
-        test_format_analysis_date()
-        test_generate_issues_table()
-        test_generate_report()
-        test_pipe_escaping()
-
-        print("=" * 60)
-        print("All tests passed! ✓")
-        print("=" * 60)
-        sys.exit(0)
-
-    except AssertionError as error:
-        print(f"\n✗ Test failed: {error}")
-        sys.exit(1)
+    pytest.main([__file__, '-v'])
@@ -4,22 +4,90 @@ Tests for SonarQubeClient API interactions.
 Uses mocking to avoid real API calls.
 """
 
-import os
-import sys
+import copy
+import io
+import json
+from types import MappingProxyType
 from unittest.mock import Mock, patch
 
 import pytest
 import requests
 
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import sonarqube_checker
+from sonarqube_checker import IssueRecord, SonarQubeClient, _literal_query_prefix
+
+# One spec'd Response mock built at import; _mock_response copies it per
+# test, which is cheaper than re-running Mock's spec introspection each time
+_RESPONSE_TEMPLATE = Mock(spec=requests.Response)
+
+# Payloads shared by several tests, built once at import and wrapped in
+# MappingProxyType so no test can mutate them for its neighbours
+_ANALYSES_PAYLOAD = MappingProxyType({'analyses': [{'date': '2024-01-15T12:00:00+0000'}]})
+# Three pages of project keys for the pagination test, frozen at import so
+# repeated runs reuse the same 300 dicts instead of rebuilding them
+_PROJECT_PAGES = tuple(
+    tuple({'key': f'project{page * 100 + j}'} for j in range(100))
+    for page in range(3)
+)
+
+_ISSUES_PAYLOAD = MappingProxyType({
+    'issues': [
+        {
+            'severity': 'MAJOR',
+            'message': 'Test issue',
+            'component': 'test:file.py',
+            'line': 42
+        },
+        {
+            'severity': 'MINOR',
+            'message': 'Another issue',
+            'component': 'test:other.py',
+            'line': 10
+        }
+    ]
+})
+
+
+def _mock_response(payload):
+    """Build a mocked requests.Response carrying the given JSON payload."""
+    mock_response = copy.copy(_RESPONSE_TEMPLATE)
+    mock_response.json = Mock(return_value=payload)
+    mock_response.content = json.dumps(payload, default=dict).encode('utf-8')
+    mock_response.raise_for_status = Mock()
+    return mock_response
+
+
+@pytest.fixture(scope='module')
+def client():
+    """One shared client per module; construction itself is covered by the init tests."""
+    return SonarQubeClient('https://sonarqube.example.com', 'token')
+
+
+@pytest.fixture(autouse=True)
+def _reset_client_cache(client):
+    """Clear the per-client analysis-date memo so tests stay independent."""
+    client._analysis_cache.clear()
 
-from sonarqube_checker import SonarQubeClient
+
+@pytest.fixture(autouse=True)
+def _force_buffered_parsing(monkeypatch):
+    """Mocked responses carry no raw byte stream; use the buffered JSON path.
+
+    The streaming branch is exercised separately by
+    test_get_latest_issues_streams_with_ijson with a real byte stream.
+    """
+    monkeypatch.setattr(sonarqube_checker, 'ijson', None)
 
 
 class TestSonarQubeClientBasics:
     """Test SonarQubeClient class."""
 
+    @pytest.fixture(autouse=True)
+    def mock_get(self):
+        """Patch Session.get once per test; bodies set return_value/side_effect."""
+        with patch('sonarqube_checker.requests.Session.get') as mocked:
+            yield mocked
+
     def test_init(self):
         """Test client initialization."""
         client = SonarQubeClient('https://sonarqube.example.com', 'test_token')
@@ -27,77 +95,92 @@ class TestSonarQubeClientBasics:
         assert client.auth.username == 'test_token'
         assert client.auth.password == ''
 
+    def test_parse_json_falls_back_to_response_json(self, monkeypatch):
+        """Without orjson the stdlib response.json() path must be used."""
+        import sonarqube_checker
+
+        monkeypatch.setattr(sonarqube_checker, 'orjson', None)
+        mock_response = _mock_response({'ok': True})
+
+        assert sonarqube_checker._parse_json(mock_response) == {'ok': True}
+
+    def test_parse_json_invalid_body_raises_request_exception(self):
+        """Non-JSON bodies (e.g. an SSO login page) must raise a RequestException."""
+        import sonarqube_checker
+
+        mock_response = copy.copy(_RESPONSE_TEMPLATE)
+        mock_response.content = b'<html>login</html>'
+        mock_response.json = Mock(side_effect=requests.exceptions.InvalidJSONError('bad body'))
+
+        with pytest.raises(requests.exceptions.RequestException):
+            sonarqube_checker._parse_json(mock_response)
+
+    def test_get_last_analysis_date_non_json_body(self, mock_get, client):
+        """A non-JSON 200 response is handled like any other request error."""
+        mock_response = copy.copy(_RESPONSE_TEMPLATE)
+        mock_response.content = b'<html>login</html>'
+        mock_response.raise_for_status = Mock()
+        mock_response.json = Mock(side_effect=requests.exceptions.InvalidJSONError('bad body'))
+        mock_get.return_value = mock_response
+
+        assert client.get_last_analysis_date('test-project') is None
+
+    def test_init_cache_falls_back_without_requests_cache(self, monkeypatch):
+        """use_cache must degrade to a plain session when requests-cache is absent."""
+        import sonarqube_checker
+
+        monkeypatch.setattr(sonarqube_checker, 'CachedSession', None)
+        client = SonarQubeClient('https://sonarqube.example.com', 'token', use_cache=True)
+        assert isinstance(client.session, requests.Session)
+
     def test_init_strips_trailing_slash(self):
         """Test that trailing slash is removed from base URL."""
         client = SonarQubeClient('https://sonarqube.example.com/', 'test_token')
         assert client.base_url == 'https://sonarqube.example.com'
 
-    @patch('sonarqube_checker.requests.Session.get')
-    def test_get_last_analysis_date_success(self, mock_get):
+    def test_get_last_analysis_date_success(self, mock_get, client):
         """Test successful retrieval of last analysis date."""
         # Mock response
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            'analyses': [
-                {'date': '2024-01-15T12:00:00+0000'}
-            ]
-        }
-        mock_response.raise_for_status = Mock()
+        mock_response = _mock_response(_ANALYSES_PAYLOAD)
         mock_get.return_value = mock_response
 
-        client = SonarQubeClient('https://sonarqube.example.com', 'token')
         result = client.get_last_analysis_date('test-project')
 
         assert result == '2024-01-15T12:00:00+0000'
         mock_get.assert_called_once()
 
-    @patch('sonarqube_checker.requests.Session.get')
-    def test_get_last_analysis_date_no_analyses(self, mock_get):
+    def test_get_last_analysis_date_no_analyses(self, mock_get, client):
         """Test when no analyses are available."""
-        mock_response = Mock()
-        mock_response.json.return_value = {'analyses': []}
-        mock_response.raise_for_status = Mock()
+        mock_response = _mock_response({'analyses': []})
         mock_get.return_value = mock_response
 
-        client = SonarQubeClient('https://sonarqube.example.com', 'token')
         result = client.get_last_analysis_date('test-project')
 
         assert result is None
 
-    def test_get_last_analysis_date_error(self):
-        """Test error handling for analysis date retrieval."""
-        client = SonarQubeClient('https://sonarqube.example.com', 'token')
+    def test_get_last_analysis_date_memoized(self, mock_get, client):
+        """Repeat lookups for the same project hit the cache, not the API."""
+        mock_get.return_value = _mock_response(_ANALYSES_PAYLOAD)
+
+        first = client.get_last_analysis_date('test-project')
+        second = client.get_last_analysis_date('test-project')
+
+        assert first == second == '2024-01-15T12:00:00+0000'
+        mock_get.assert_called_once()
 
+    def test_get_last_analysis_date_error(self, client):
+        """Test error handling for analysis date retrieval."""
         # Mock the session.get to raise an exception
         with patch.object(client.session, 'get', side_effect=requests.exceptions.RequestException('Network error')):
             result = client.get_last_analysis_date('test-project')
 
         assert result is None
 
-    @patch('sonarqube_checker.requests.Session.get')
-    def test_get_latest_issues_success(self, mock_get):
+    def test_get_latest_issues_success(self, mock_get, client):
         """Test successful retrieval of issues."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            'issues': [
-                {
-                    'severity': 'MAJOR',
-                    'message': 'Test issue',
-                    'component': 'test:file.py',
-                    'line': 42
-                },
-                {
-                    'severity': 'MINOR',
-                    'message': 'Another issue',
-                    'component': 'test:other.py',
-                    'line': 10
-                }
-            ]
-        }
-        mock_response.raise_for_status = Mock()
+        mock_response = _mock_response(_ISSUES_PAYLOAD)
         mock_get.return_value = mock_response
 
-        client = SonarQubeClient('https://sonarqube.example.com', 'token')
         result = client.get_latest_issues('test-project', max_issues=10)
 
         assert len(result) == 2
@@ -105,35 +188,27 @@ class TestSonarQubeClientBasics:
         assert result[0]['message'] == 'Test issue'
         assert result[1]['line'] == 10
 
-    @patch('sonarqube_checker.requests.Session.get')
-    def test_get_latest_issues_no_issues(self, mock_get):
+    def test_get_latest_issues_no_issues(self, mock_get, client):
         """Test when no issues are found."""
-        mock_response = Mock()
-        mock_response.json.return_value = {'issues': []}
-        mock_response.raise_for_status = Mock()
+        mock_response = _mock_response({'issues': []})
         mock_get.return_value = mock_response
 
-        client = SonarQubeClient('https://sonarqube.example.com', 'token')
         result = client.get_latest_issues('test-project')
 
         assert result == []
 
-    @patch('sonarqube_checker.requests.Session.get')
-    def test_get_latest_issues_missing_fields(self, mock_get):
+    def test_get_latest_issues_missing_fields(self, mock_get, client):
         """Test handling of issues with missing fields."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response = _mock_response({
             'issues': [
                 {
                     'severity': 'MAJOR'
                     # Missing message, component, line
                 }
             ]
-        }
-        mock_response.raise_for_status = Mock()
+        })
         mock_get.return_value = mock_response
 
-        client = SonarQubeClient('https://sonarqube.example.com', 'token')
         result = client.get_latest_issues('test-project')
 
         assert len(result) == 1
@@ -142,10 +217,107 @@ class TestSonarQubeClientBasics:
         assert result[0]['component'] == 'N/A'
         assert result[0]['line'] == 'N/A'
 
-    def test_get_latest_issues_error(self):
-        """Test error handling for issues retrieval."""
-        client = SonarQubeClient('https://sonarqube.example.com', 'token')
+    def test_get_latest_issues_streams_with_ijson(self, mock_get, client, monkeypatch):
+        """The ijson branch parses issues incrementally from the raw byte stream."""
+        ijson = pytest.importorskip('ijson')
+        monkeypatch.setattr(sonarqube_checker, 'ijson', ijson)
+
+        payload = json.dumps({'issues': [
+            {'severity': 'MAJOR', 'message': 'Streamed', 'component': 'test:a.py', 'line': 1}
+        ]}).encode('utf-8')
+
+        class _RawStream(io.BytesIO):
+            """BytesIO subclass that accepts the decode_content attribute."""
+
+        mock_response = copy.copy(_RESPONSE_TEMPLATE)
+        mock_response.raw = _RawStream(payload)
+        mock_response.raise_for_status = Mock()
+        mock_get.return_value = mock_response
+
+        result = client.get_latest_issues('test-project')
+
+        assert [issue['message'] for issue in result] == ['Streamed']
+        assert mock_get.call_args.kwargs.get('stream') is True
+
+    def test_get_latest_issues_paginates_past_500(self, mock_get, client):
+        """Limits above SonarQube's ps cap of 500 must page through results."""
+        def page_payload(start, count):
+            return {
+                'issues': [
+                    {'severity': 'MAJOR', 'message': f'Issue {start + i}', 'component': 'test:a.py', 'line': start + i}
+                    for i in range(count)
+                ]
+            }
 
+        mock_get.side_effect = [
+            _mock_response(page_payload(0, 500)),
+            _mock_response(page_payload(500, 100)),
+        ]
+
+        result = client.get_latest_issues('test-project', max_issues=600)
+
+        assert mock_get.call_count == 2
+        assert len(result) == 600
+        assert result[0]['message'] == 'Issue 0'
+        assert result[-1]['message'] == 'Issue 599'
+
+    def test_get_latest_issues_bulk_buckets_by_project(self, mock_get, client):
+        """Bulk fetch should bucket issues under their project key."""
+        mock_response = _mock_response({
+            'issues': [
+                {'project': 'proj1', 'severity': 'MAJOR', 'message': 'First', 'component': 'proj1:a.py', 'line': 1},
+                {'project': 'proj2', 'severity': 'MINOR', 'message': 'Second', 'component': 'proj2:b.py', 'line': 2},
+                {'project': 'proj1', 'severity': 'INFO', 'message': 'Third', 'component': 'proj1:c.py', 'line': 3},
+            ],
+            'paging': {'total': 3}
+        })
+        mock_get.return_value = mock_response
+
+        result = client.get_latest_issues_bulk(['proj1', 'proj2'])
+
+        assert mock_get.call_count == 1
+        assert len(result['proj1']) == 2
+        assert len(result['proj2']) == 1
+        assert result['proj1'][0]['message'] == 'First'
+
+    def test_get_latest_issues_bulk_truncates_per_project(self, mock_get, client):
+        """Each project bucket must be capped at max_issues_per_project."""
+        mock_response = _mock_response({
+            'issues': [
+                {'project': 'proj1', 'severity': 'MAJOR', 'message': f'Issue {i}', 'component': 'proj1:a.py', 'line': i}
+                for i in range(5)
+            ],
+            'paging': {'total': 5}
+        })
+        mock_get.return_value = mock_response
+
+        result = client.get_latest_issues_bulk(['proj1'], max_issues_per_project=2)
+
+        assert len(result['proj1']) == 2
+        assert result['proj1'][0]['message'] == 'Issue 0'
+
+    def test_get_latest_issues_bulk_backfills_past_result_window(self, mock_get, client):
+        """Buckets still empty at SonarQube's 10k result window get their own query."""
+        bulk_page = _mock_response({'issues': [], 'paging': {'total': 100000}})
+        backfill = _mock_response({'issues': [
+            {'severity': 'MAJOR', 'message': 'Deep issue', 'component': 'quiet:a.py', 'line': 1}
+        ]})
+        mock_get.side_effect = [bulk_page] * 20 + [backfill]
+
+        result = client.get_latest_issues_bulk(['quiet'], max_issues_per_project=500)
+
+        assert mock_get.call_count == 21
+        assert [issue['message'] for issue in result['quiet']] == ['Deep issue']
+
+    def test_get_latest_issues_bulk_error(self, client):
+        """Network errors should yield empty buckets for every project."""
+        with patch.object(client.session, 'get', side_effect=requests.exceptions.RequestException('Network error')):
+            result = client.get_latest_issues_bulk(['proj1', 'proj2'])
+
+        assert result == {'proj1': [], 'proj2': []}
+
+    def test_get_latest_issues_error(self, client):
+        """Test error handling for issues retrieval."""
         # Mock the session.get to raise an exception
         with patch.object(client.session, 'get', side_effect=requests.exceptions.RequestException('Network error')):
             result = client.get_latest_issues('test-project')
@@ -153,25 +325,61 @@ class TestSonarQubeClientBasics:
         assert result == []
 
 
+class TestIssueRecord:
+    """Tests for the compact IssueRecord issue representation."""
+
+    def test_from_api_defaults_missing_fields(self):
+        """Fields absent from the API payload fall back to 'N/A'."""
+        record = IssueRecord.from_api({'severity': 'MAJOR'})
+
+        assert record.severity == 'MAJOR'
+        assert record.message == 'N/A'
+        assert record['component'] == 'N/A'
+        assert record.get('line') == 'N/A'
+
+    def test_from_api_tolerates_explicit_nulls(self):
+        """Explicit JSON nulls fall back to 'N/A' like missing keys."""
+        record = IssueRecord.from_api({'severity': None, 'component': None})
+
+        assert record.severity == 'N/A'
+        assert record.component == 'N/A'
+
+    def test_record_has_no_instance_dict(self):
+        """__slots__ must suppress the per-instance __dict__."""
+        record = IssueRecord.from_api({})
+
+        assert not hasattr(record, '__dict__')
+        with pytest.raises(KeyError):
+            record['unknown']
+
+    def test_to_dict_round_trip(self):
+        """to_dict produces the JSON shape the state file persists."""
+        payload = {'severity': 'MINOR', 'message': 'm', 'component': 'c', 'line': 3}
+
+        assert IssueRecord.from_api(payload).to_dict() == payload
+
+
 class TestSonarQubeClientProjectDiscovery:
     """Test project discovery and filtering functionality."""
 
-    @patch('sonarqube_checker.requests.Session.get')
-    def test_get_projects_success(self, mock_get):
+    @pytest.fixture(autouse=True)
+    def mock_get(self):
+        """Patch Session.get once per test; bodies set return_value/side_effect."""
+        with patch('sonarqube_checker.requests.Session.get') as mocked:
+            yield mocked
+
+    def test_get_projects_success(self, mock_get, client):
         """Test successful retrieval of all projects in single page."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response = _mock_response({
             'components': [
                 {'key': 'project1'},
                 {'key': 'project2'},
                 {'key': 'MyProject.service'}
             ],
             'paging': {'total': 3}
-        }
-        mock_response.raise_for_status = Mock()
+        })
         mock_get.return_value = mock_response
 
-        client = SonarQubeClient('https://sonarqube.example.com', 'token')
         result = client.get_projects()
 
         assert len(result) == 3
@@ -179,11 +387,9 @@ class TestSonarQubeClientProjectDiscovery:
         assert 'project2' in result
         assert 'MyProject.service' in result
 
-    @patch('sonarqube_checker.requests.Session.get')
-    def test_get_projects_with_pattern(self, mock_get):
+    def test_get_projects_with_pattern(self, mock_get, client):
         """Test project filtering with RegExp pattern."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response = _mock_response({
             'components': [
                 {'key': 'project1'},
                 {'key': 'MyProject.service'},
@@ -191,11 +397,9 @@ class TestSonarQubeClientProjectDiscovery:
                 {'key': 'OtherProject.app'}
             ],
             'paging': {'total': 4}
-        }
-        mock_response.raise_for_status = Mock()
+        })
         mock_get.return_value = mock_response
 
-        client = SonarQubeClient('https://sonarqube.example.com', 'token')
         result = client.get_projects(pattern=r'MyProject\.')
 
         assert len(result) == 2
@@ -204,68 +408,79 @@ class TestSonarQubeClientProjectDiscovery:
         assert 'project1' not in result
         assert 'OtherProject.app' not in result
 
-    @patch('sonarqube_checker.requests.Session.get')
-    def test_get_projects_no_matches(self, mock_get):
+    def test_get_projects_no_matches(self, mock_get, client):
         """Test when no projects match the pattern."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response = _mock_response({
             'components': [
                 {'key': 'project1'},
                 {'key': 'project2'}
             ],
             'paging': {'total': 2}
-        }
-        mock_response.raise_for_status = Mock()
+        })
         mock_get.return_value = mock_response
 
-        client = SonarQubeClient('https://sonarqube.example.com', 'token')
         result = client.get_projects(pattern=r'NonExistent\.')
 
         assert result == []
 
-    @patch('sonarqube_checker.requests.Session.get')
-    def test_get_projects_empty_response(self, mock_get):
+    def test_get_projects_empty_response(self, mock_get, client):
         """Test when SonarQube returns no projects."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response = _mock_response({
             'components': [],
             'paging': {'total': 0}
-        }
-        mock_response.raise_for_status = Mock()
+        })
         mock_get.return_value = mock_response
 
-        client = SonarQubeClient('https://sonarqube.example.com', 'token')
         result = client.get_projects()
 
         assert result == []
 
-    def test_get_projects_error(self):
+    def test_get_projects_error(self, client):
         """Test error handling for project retrieval."""
-        client = SonarQubeClient('https://sonarqube.example.com', 'token')
-
         # Mock the session.get to raise an exception
         with patch.object(client.session, 'get', side_effect=requests.exceptions.RequestException('Network error')):
             result = client.get_projects()
 
         assert result == []
 
-    @patch('sonarqube_checker.requests.Session.get')
-    def test_get_projects_pagination(self, mock_get):
+    def test_literal_query_prefix(self):
+        """The q filter should be the literal prefix of the pattern, if long enough."""
+        assert _literal_query_prefix(r'MyProject\.') == 'MyProject'
+        assert _literal_query_prefix(r'.*service') is None
+        assert _literal_query_prefix(r'ab\.') is None  # too short for SonarQube's q
+        assert _literal_query_prefix('plain-substring') == 'plain-substring'
+        # Alternation: other branches need not share the prefix
+        assert _literal_query_prefix('alpha|other') is None
+        # Quantifiers making the last literal optional must drop it
+        assert _literal_query_prefix('abcd?') == 'abc'
+        assert _literal_query_prefix('abcd*') == 'abc'
+        assert _literal_query_prefix('abcd{0,1}') == 'abc'
+        assert _literal_query_prefix('abc?') is None  # remaining prefix too short
+        # '+' requires at least one occurrence, so the prefix stays intact
+        assert _literal_query_prefix('abcd+') == 'abcd'
+
+    def test_get_projects_pattern_sends_query_filter(self, mock_get, client):
+        """A pattern with a literal prefix should be pushed server-side via q."""
+        mock_response = _mock_response({
+            'components': [{'key': 'MyProject.service'}],
+            'paging': {'total': 1}
+        })
+        mock_get.return_value = mock_response
+
+        result = client.get_projects(pattern=r'MyProject\.')
+
+        assert result == ['MyProject.service']
+        _, kwargs = mock_get.call_args
+        assert kwargs['params']['q'] == 'MyProject'
+
+    def test_get_projects_pagination(self, mock_get, client):
         """Test that pagination works correctly."""
         # Simulate multiple pages
-        responses = []
-        for i in range(3):
-            mock_resp = Mock()
-            mock_resp.json.return_value = {
-                'components': [{'key': f'project{i*100 + j}'} for j in range(100)],
-                'paging': {'total': 250}
-            }
-            mock_resp.raise_for_status = Mock()
-            responses.append(mock_resp)
-
-        mock_get.side_effect = responses
+        mock_get.side_effect = [
+            _mock_response({'components': list(page), 'paging': {'total': 250}})
+            for page in _PROJECT_PAGES
+        ]
 
-        client = SonarQubeClient('https://sonarqube.example.com', 'token')
         result = client.get_projects()
 
         # Should have made 3 requests (300 projects total, which is > 250 total)